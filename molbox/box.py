@@ -1,10 +1,14 @@
 """generic box module."""
+import math
+from copy import deepcopy
 from warnings import warn
 
 import numpy as np
 
 __all__ = ["Box", "BoxError"]
 
+_RIGHT_ANGLES = (90.0, 90.0, 90.0)
+
 
 class BoxError(Exception):
     """Exception to be raised when there's an error in Box methods"""
@@ -28,7 +32,8 @@ class Box(object):
     Attributes
     ----------
     vectors : np.ndarray, shape=(3,3), dtype=float
-        Vectors that define the parallelepiped (Box).
+        Vectors that define the parallelepiped (Box). The array is read-only,
+        build a new Box to change them.
     lengths : tuple, shape=(3,), dtype=float
         Lengths of the box in x,y,z
     angles : tuple, shape=(3,), dtype=float
@@ -56,6 +61,21 @@ class Box(object):
     Box vectors are expected to be provided in row-major format.
     """
 
+    __slots__ = (
+        "_precision",
+        "_vectors",
+        "_Lx",
+        "_Ly",
+        "_Lz",
+        "_xy",
+        "_xz",
+        "_yz",
+        "_angles",
+        "_rounded_lengths",
+        "_rounded_tilt_factors",
+        "_rounded_angles",
+    )
+
     def __init__(self, lengths, angles=None, precision=None):
         if precision is not None:
             self._precision = int(precision)
@@ -63,18 +83,14 @@ class Box(object):
             self._precision = 6
 
         if angles is None:
-            angles = [90.0, 90.0, 90.0]
+            angles = _RIGHT_ANGLES
 
-        self._vectors = _lengths_angles_to_vectors(
-            lengths=lengths, angles=angles, precision=self.precision
+        self._vectors = _read_only(
+            _lengths_angles_to_vectors(
+                lengths=lengths, angles=angles, precision=self.precision
+            )
         )
-        (Lx, Ly, Lz, xy, xz, yz) = self._from_vecs_to_lengths_tilt_factors()
-        self._Lx = Lx
-        self._Ly = Ly
-        self._Lz = Lz
-        self._xy = xy
-        self._xz = xz
-        self._yz = yz
+        self._derive_parameters()
 
     @classmethod
     def from_lengths_angles(cls, lengths, angles, precision=None):
@@ -166,62 +182,58 @@ class Box(object):
 
     @property
     def vectors(self):
-        """Box representation as a 3x3 matrix."""
+        """Box representation as a 3x3 matrix, read-only."""
         return self._vectors
 
     @property
     def box_parameters(self):
         """Lengths and tilt factors of the box."""
-        return self.Lx, self.Ly, self.Lz, self.xy, self.xz, self.xy
+        return self.lengths + self.tilt_factors
 
     @property
     def Lx(self):
         """Length in the x direction."""
-        return round(self._Lx, self.precision)
+        return self._rounded_lengths[0]
 
     @property
     def Ly(self):
         """Length in the y direction."""
-        return round(self._Ly, self.precision)
+        return self._rounded_lengths[1]
 
     @property
     def Lz(self):
         """Length in the z direction."""
-        return round(self._Lz, self.precision)
+        return self._rounded_lengths[2]
 
     @property
     def lengths(self):
         """Lengths of the box."""
-        return self.Lx, self.Ly, self.Lz
+        return self._rounded_lengths
 
     @property
     def xy(self):
         """Tilt factor xy of the box."""
-        return round(self._xy, self.precision)
+        return self._rounded_tilt_factors[0]
 
     @property
     def xz(self):
         """Tilt factor xz of the box."""
-        return round(self._xz, self.precision)
+        return self._rounded_tilt_factors[1]
 
     @property
     def yz(self):
         """Tilt factor yz of the box."""
-        return round(self._yz, self.precision)
+        return self._rounded_tilt_factors[2]
 
     @property
     def tilt_factors(self):
         """Return the 3 tilt_factors (xy, xz, yz) of the box."""
-        return self.xy, self.xz, self.yz
+        return self._rounded_tilt_factors
 
     @property
     def angles(self):
         """Angles defining the tilt of the box (alpha, beta, gamma)."""
-        (alpha, beta, gamma) = self._get_angles()
-        alpha = round(alpha, self.precision)
-        beta = round(beta, self.precision)
-        gamma = round(gamma, self.precision)
-        return alpha, beta, gamma
+        return self._rounded_angles
 
     @property
     def precision(self):
@@ -231,11 +243,12 @@ class Box(object):
     @precision.setter
     def precision(self, value):
         """Decimal point precision, if None use 16, else cast as int."""
-        if not value:
+        if value is None:
             precision = 16
         else:
             precision = int(value)
         self._precision = precision
+        self._round_parameters()
 
     @property
     def bravais_parameters(self):
@@ -256,10 +269,46 @@ class Box(object):
         (Lx, Ly, Lz) = self.lengths
         return Lx, Ly, Lz, alpha, beta, gamma
 
+    def __deepcopy__(self, memo):
+        """Copy the box, duplicating only the mutable vectors array.
+
+        Every other Box slot is an immutable int, float, or tuple, which can be
+        shared with the copy instead of going through `copy.deepcopy`.
+        Subclasses declaring their own `__slots__` need to extend this method,
+        as well as `__getstate__` and `__setstate__`, to copy those slots.
+        """
+        cls = self.__class__
+        newone = cls.__new__(cls)
+        memo[id(self)] = newone
+        for attr in Box.__slots__:
+            setattr(newone, attr, getattr(self, attr))
+        newone._vectors = _read_only(self._vectors.copy())
+        if hasattr(self, "__dict__"):
+            newone.__dict__.update(deepcopy(self.__dict__, memo))
+        return newone
+
+    def __getstate__(self):
+        """Return the precision and vectors, everything else is derived."""
+        state = {"_precision": self._precision, "_vectors": self._vectors}
+        if hasattr(self, "__dict__"):
+            state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state):
+        """Restore a box, also from the __dict__ of boxes without slots."""
+        state = dict(state)
+        self._precision = state.pop("_precision")
+        self._vectors = _read_only(np.array(state.pop("_vectors")))
+        for attr in Box.__slots__:
+            state.pop(attr, None)
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self._derive_parameters()
+
     def __repr__(self):
         """Return a string representation of the box."""
         (Lx, Ly, Lz, xy, xz, yz) = self.box_parameters
-        format_precision = f".{self._precision}f" if self._precision else ""
+        format_precision = f".{self._precision}f"
         desc = (
             f"Box: Lx={Lx:{format_precision}}, "
             f"Ly={Ly:{format_precision}}, "
@@ -272,10 +321,7 @@ class Box(object):
 
     def _from_vecs_to_lengths_tilt_factors(self):
         # vectors should already be aligned by _normalize_box
-        v = np.zeros((3, 3))
-        v[0, :] = self._vectors[0, :]
-        v[1, :] = self._vectors[1, :]
-        v[2, :] = self._vectors[2, :]
+        v = self._vectors
 
         Lx = np.sqrt(np.dot(v[0], v[0]))
         a2x = np.dot(v[0], v[1]) / Lx
@@ -288,13 +334,50 @@ class Box(object):
         xz = a3x / Lz
         yz = (np.dot(v[1], v[2]) - a2x * a3x) / (Ly * Lz)
 
-        len_x = np.sqrt(np.dot(v[0], v[0]))
+        # Lx is already the magnitude of the first vector
         len_y = np.sqrt(np.dot(v[1], v[1]))
         len_z = np.sqrt(np.dot(v[2], v[2]))
-        return len_x, len_y, len_z, xy, xz, yz
+        return Lx, len_y, len_z, xy, xz, yz
+
+    def _derive_parameters(self):
+        (Lx, Ly, Lz, xy, xz, yz) = self._from_vecs_to_lengths_tilt_factors()
+        self._Lx = Lx
+        self._Ly = Ly
+        self._Lz = Lz
+        self._xy = xy
+        self._xz = xz
+        self._yz = yz
+        self._angles = _calc_angles(self._vectors)
+        self._round_parameters()
+
+    def _round_parameters(self):
+        # the public parameters only change with precision, so round them
+        # once here rather than on every property access
+        precision = self._precision
+        self._rounded_lengths = (
+            round(self._Lx, precision),
+            round(self._Ly, precision),
+            round(self._Lz, precision),
+        )
+        self._rounded_tilt_factors = (
+            round(self._xy, precision),
+            round(self._xz, precision),
+            round(self._yz, precision),
+        )
+        self._rounded_angles = tuple(
+            round(angle, precision) for angle in self._angles
+        )
 
-    def _get_angles(self):
-        return _calc_angles(self.vectors)
+
+def _read_only(vectors):
+    """Return a read-only view of the box vectors.
+
+    The derived lengths, tilt factors, and angles are computed from the
+    vectors at construction, so they must not be modified in place. Freezing
+    the owning array as well keeps the view's flag from being reset.
+    """
+    vectors.flags.writeable = False
+    return vectors.view()
 
 
 def _validate_box_vectors(box_vectors):
@@ -323,14 +406,28 @@ def _validate_box_vectors(box_vectors):
 
 def _lengths_angles_to_vectors(lengths, angles, precision):
     (a, b, c) = lengths
-    (alpha, beta, gamma) = np.deg2rad(angles)
-    cos_a = np.clip(np.cos(alpha), -1.0, 1.0)
-    cos_b = np.clip(np.cos(beta), -1.0, 1.0)
-    cos_g = np.clip(np.cos(gamma), -1.0, 1.0)
-
-    sin_a = np.clip(np.sin(alpha), -1.0, 1.0)
-    sin_b = np.clip(np.sin(beta), -1.0, 1.0)
-    sin_g = np.clip(np.sin(gamma), -1.0, 1.0)
+    (alpha, beta, gamma) = angles
+    if alpha == beta == gamma == 90.0:
+        # orthorhombic boxes are diagonal, skip the trigonometry
+        box_vectors = np.diag(np.asarray([a, b, c], dtype=np.float64))
+    else:
+        box_vectors = _triclinic_vectors(a, b, c, alpha, beta, gamma)
+    # the vectors are built in reduced form, so only the determinant checks of
+    # _normalize_box are needed here, not the QR alignment
+    _check_determinant(box_vectors)
+    return box_vectors.round(precision)
+
+
+def _triclinic_vectors(a, b, c, alpha, beta, gamma):
+    # scalar math avoids numpy ufunc dispatch on single floats
+    alpha = math.radians(alpha)
+    beta = math.radians(beta)
+    gamma = math.radians(gamma)
+    cos_a = math.cos(alpha)
+    cos_b = math.cos(beta)
+    cos_g = math.cos(gamma)
+
+    sin_g = math.sin(gamma)
     a_vec = np.asarray([a, 0.0, 0.0])
 
     b_x = b * cos_g
@@ -338,26 +435,25 @@ def _lengths_angles_to_vectors(lengths, angles, precision):
     b_vec = np.asarray([b_x, b_y, 0.0])
 
     c_x = c * cos_b
+    if sin_g == 0.0:
+        # a and b are parallel, c_y and c_z are undefined
+        vectors = np.asarray((a_vec, b_vec, [c_x, np.nan, np.nan]))
+        raise BoxError(
+            "The vectors to define the box are co-linear, this does not form a "
+            f"3D region in space.\n Box vectors evaluated: {vectors}"
+        )
     c_cos_y_term = (cos_a - (cos_b * cos_g)) / sin_g
     c_y = c * c_cos_y_term
-    c_z = c * np.sqrt(1 - np.square(cos_b) - np.square(c_cos_y_term))
+    # np.sqrt keeps NaN for incompatible angles, where math.sqrt would raise
+    c_z = c * np.sqrt(1 - cos_b * cos_b - c_cos_y_term * c_cos_y_term)
     c_vec = np.asarray([c_x, c_y, c_z])
     box_vectors = np.asarray((a_vec, b_vec, c_vec))
     box_vectors.reshape(3, 3)
-    _validate_box_vectors(box_vectors=box_vectors)
-    return box_vectors.round(precision)
+    return box_vectors
 
 
-def _normalize_box(vectors):
-    """Align the box matrix into a right-handed coordinate frame.
-
-    NOTE: This assumes that the matrix is in a row-major format.
-
-    NOTE: Inspiration and logic are from the Glotzer group package, Garnett;
-    which is provided under a BSD 3-clause License.
-    For additional information, refer to the License file provided with this
-    package.
-    """
+def _check_determinant(vectors):
+    """Raise for co-linear box vectors, warn for a left-handed basis."""
     det = np.linalg.det(vectors)
     if np.isclose(det, 0.0, atol=1e-5):
         raise BoxError(
@@ -370,18 +466,29 @@ def _normalize_box(vectors):
             "transformed into a right-handed basis automatically."
         )
 
+
+def _normalize_box(vectors):
+    """Align the box matrix into a right-handed coordinate frame.
+
+    NOTE: This assumes that the matrix is in a row-major format.
+
+    NOTE: Inspiration and logic are from the Glotzer group package, Garnett;
+    which is provided under a BSD 3-clause License.
+    For additional information, refer to the License file provided with this
+    package.
+    """
+    _check_determinant(vectors)
+
     # transpose to column-major for the time being
     Q, R = np.linalg.qr(vectors.T)
 
     # left or right handed: det<0 left, >0, right
     sign = np.linalg.det(Q)
-    R = R * sign
+    R *= sign
 
-    signs = np.diag(
-        np.diag(np.where(R < 0, -np.ones(R.shape), np.ones(R.shape)))
-    )
-    transformed_vecs = R.dot(signs)
-    return _reduced_form_vectors(transformed_vecs.T)
+    # flip columns with a negative diagonal entry, in place
+    R *= np.where(np.diag(R) < 0, -1.0, 1.0)
+    return _reduced_form_vectors(R.T)
 
 
 def _reduced_form_vectors(box_vectors):
@@ -418,10 +525,6 @@ def _calc_angles(vectors):
     attribute box_vectors, rounded to 'precision' number of decimal points.
     """
     vector_magnitudes = np.linalg.norm(vectors, axis=1)
-    v = np.zeros((3, 3))
-    v[0, :] = vectors[0, :]
-    v[1, :] = vectors[1, :]
-    v[2, :] = vectors[2, :]
 
     a_dot_b = np.dot(vectors[0], vectors[1])
     b_dot_c = np.dot(vectors[1], vectors[2])
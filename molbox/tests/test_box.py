@@ -1,3 +1,6 @@
+import pickle
+from copy import deepcopy
+
 import numpy as np
 import pytest
 
@@ -66,6 +69,18 @@ class TestBox:
         with pytest.raises(BoxError, match=r"co\-linear"):
             molbox.Box.from_vectors(vectors=vecs)
 
+    @pytest.mark.parametrize(
+        "angles", [[90, 90], [], [90, 90, 90, 90], [90, 90, 120, 90]]
+    )
+    def test_wrong_number_of_angles(self, angles):
+        with pytest.raises(ValueError):
+            molbox.Box(lengths=[1, 2, 3], angles=angles)
+
+    @pytest.mark.parametrize("gamma", [0, 180])
+    def test_degenerate_gamma(self, gamma):
+        with pytest.raises(BoxError, match=r"co\-linear"):
+            molbox.Box(lengths=[1, 2, 3], angles=[90, 90, gamma])
+
     @pytest.mark.parametrize(
         "vecs",
         [
@@ -157,3 +172,106 @@ class TestBox:
                 list(box.bravais_parameters), [a, b, c, alpha, beta, gamma]
             )
         )
+
+    @pytest.mark.parametrize(
+        "xyz, angles",
+        [
+            ([[0, 0, 0], [1, 2, 3]], [90, 90, 90]),
+            ([[-1, 0.5, 2], [3, -1, 0], [0, 4, 1]], [90, 90, 120]),
+        ],
+    )
+    def test_mins_maxs_angles(self, xyz, angles):
+        xyz = np.asarray(xyz)
+        box = molbox.Box.from_mins_maxs_angles(
+            mins=xyz.min(axis=0), maxs=xyz.max(axis=0), angles=angles
+        )
+        assert np.all(
+            np.isclose(box.lengths, xyz.max(axis=0) - xyz.min(axis=0))
+        )
+        assert np.all(np.isclose(box.angles, angles))
+
+    def test_deepcopy(self):
+        box = molbox.Box(lengths=[3, 6, 7], angles=[97, 99, 120], precision=4)
+        box_copy = deepcopy(box)
+        assert box_copy is not box
+        assert not np.shares_memory(box_copy.vectors, box.vectors)
+        assert np.all(np.isclose(box_copy.vectors, box.vectors))
+        assert box_copy.bravais_parameters == box.bravais_parameters
+        assert box_copy.precision == box.precision
+
+    def test_deepcopy_subclass_state(self):
+        class TaggedBox(molbox.Box):
+            pass
+
+        box = TaggedBox(lengths=[1, 2, 3])
+        box.tags = ["solvent"]
+        box_copy = deepcopy(box)
+        assert box_copy.tags == box.tags
+        assert box_copy.tags is not box.tags
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_slots_and_pickle(self, protocol):
+        box = molbox.Box(lengths=[3, 6, 7], angles=[97, 99, 120], precision=4)
+        assert not hasattr(box, "__dict__")
+        loaded = pickle.loads(pickle.dumps(box, protocol=protocol))
+        assert np.all(np.isclose(loaded.vectors, box.vectors))
+        assert not loaded.vectors.flags.writeable
+        assert loaded.bravais_parameters == box.bravais_parameters
+        assert loaded.precision == box.precision
+
+    def test_unpickle_dict_state(self):
+        # boxes pickled before Box declared __slots__ carry a plain __dict__
+        box = molbox.Box(lengths=[3, 6, 7], angles=[97, 99, 120], precision=4)
+        old_state = {
+            "_precision": 4,
+            "_vectors": np.array(box.vectors),
+            "_Lx": box.Lx,
+            "_Ly": box.Ly,
+            "_Lz": box.Lz,
+            "_xy": box.xy,
+            "_xz": box.xz,
+            "_yz": box.yz,
+        }
+        loaded = molbox.Box.__new__(molbox.Box)
+        loaded.__setstate__(old_state)
+        assert loaded.bravais_parameters == box.bravais_parameters
+        assert loaded.tilt_factors == box.tilt_factors
+
+    @pytest.mark.parametrize(
+        "precision, expected", [(None, 16), (0, 0), (3, 3), ("8", 8)]
+    )
+    def test_set_precision(self, precision, expected):
+        box = molbox.Box(lengths=[1.23456, 1, 1])
+        box.precision = precision
+        assert box.precision == expected
+        assert box.Lx == round(1.23456, expected)
+        assert f"Lx={round(1.23456, expected):.{expected}f}," in repr(box)
+
+    @pytest.mark.parametrize(
+        "lengths, tilt_factors",
+        [
+            ([1, 1, 1], [0.0, 0.0, 0.0]),
+            ([3.0, 2.0, 1.0], [-0.57735, 0.25, 0.5]),
+        ],
+    )
+    def test_box_parameters(self, lengths, tilt_factors):
+        box = molbox.Box.from_lengths_tilt_factors(lengths, tilt_factors)
+        assert np.all(
+            np.isclose(box.box_parameters, [*lengths, *tilt_factors])
+        )
+
+    @pytest.mark.parametrize("precision", [None, 16])
+    def test_orthorhombic_vectors(self, precision):
+        box = molbox.Box(lengths=[10, 20, 30], precision=precision)
+        assert np.array_equal(box.vectors, np.diag([10.0, 20.0, 30.0]))
+        assert box.angles == (90.0, 90.0, 90.0)
+        assert box.tilt_factors == (0.0, 0.0, 0.0)
+
+    def test_vectors_read_only(self):
+        box = molbox.Box(lengths=[1, 1, 1])
+        with pytest.raises(ValueError, match=r"read\-only"):
+            box.vectors[1] = [1, 2, 0]
+        with pytest.raises(ValueError):
+            box.vectors.setflags(write=True)
+        assert not deepcopy(box).vectors.flags.writeable
+        assert box.angles == (90.0, 90.0, 90.0)